@@ -23,6 +23,7 @@ from anyway.sdk.config import (
     is_tracing_enabled,
     is_metrics_enabled,
     is_logging_enabled,
+    refresh_config,
 )
 from anyway.sdk.fetcher import Fetcher
 from anyway.sdk.tracing.tracing import (
@@ -86,6 +87,9 @@ class Traceloop:
         api_key = os.getenv("TRACELOOP_API_KEY") or api_key
         Traceloop.__app_name = app_name
 
+        # Pick up TRACELOOP_* flags set after this module was imported
+        refresh_config()
+
         if not is_tracing_enabled():
             print(Fore.YELLOW + "Tracing is disabled" + Fore.RESET)
             return
@@ -142,15 +146,19 @@ class Traceloop:
                     )
                 pricing_calculator = PricingCalculator(pricing_data)
 
-                # Wrap existing callback or create new one
+                # Wrap existing callback, or register the calculator directly so
+                # spans don't pay for an extra wrapper frame
                 original_callback = span_postprocess_callback
 
-                def pricing_callback(span: ReadableSpan) -> None:
-                    if original_callback:
+                if original_callback:
+
+                    def pricing_callback(span: ReadableSpan) -> None:
                         original_callback(span)
-                    pricing_calculator.add_cost_attributes(span)
+                        pricing_calculator.add_cost_attributes(span)
 
-                span_postprocess_callback = pricing_callback
+                    span_postprocess_callback = pricing_callback
+                else:
+                    span_postprocess_callback = pricing_calculator.add_cost_attributes
             except Exception as e:
                 logging.warning(f"Failed to initialize pricing: {e}")
 
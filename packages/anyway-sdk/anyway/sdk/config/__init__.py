@@ -1,17 +1,40 @@
 import os
 
 
+def _env_flag(name: str, default: str) -> bool:
+    return (os.getenv(name) or default).lower() == "true"
+
+
+# Defaults, overwritten by refresh_config() below at import and again from Traceloop.init
+_TRACING_ENABLED: bool = True
+_CONTENT_TRACING_ENABLED: bool = True
+_METRICS_ENABLED: bool = True
+_LOGGING_ENABLED: bool = False
+
+
+def refresh_config() -> None:
+    """Re-read the TRACELOOP_* feature flags from the environment."""
+    global _TRACING_ENABLED, _CONTENT_TRACING_ENABLED, _METRICS_ENABLED, _LOGGING_ENABLED
+    _TRACING_ENABLED = _env_flag("TRACELOOP_TRACING_ENABLED", "true")
+    _CONTENT_TRACING_ENABLED = _env_flag("TRACELOOP_TRACE_CONTENT", "true")
+    _METRICS_ENABLED = _env_flag("TRACELOOP_METRICS_ENABLED", "true")
+    _LOGGING_ENABLED = _env_flag("TRACELOOP_LOGGING_ENABLED", "false")
+
+
+refresh_config()
+
+
 def is_tracing_enabled() -> bool:
-    return (os.getenv("TRACELOOP_TRACING_ENABLED") or "true").lower() == "true"
+    return _TRACING_ENABLED
 
 
 def is_content_tracing_enabled() -> bool:
-    return (os.getenv("TRACELOOP_TRACE_CONTENT") or "true").lower() == "true"
+    return _CONTENT_TRACING_ENABLED
 
 
 def is_metrics_enabled() -> bool:
-    return (os.getenv("TRACELOOP_METRICS_ENABLED") or "true").lower() == "true"
+    return _METRICS_ENABLED
 
 
 def is_logging_enabled() -> bool:
-    return (os.getenv("TRACELOOP_LOGGING_ENABLED") or "false").lower() == "true"
+    return _LOGGING_ENABLED
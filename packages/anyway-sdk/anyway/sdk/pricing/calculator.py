@@ -1,7 +1,50 @@
-import re
-from typing import Optional
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, MutableMapping, Optional, cast
 
 from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.semconv._incubating.attributes import (
+    gen_ai_attributes as GenAIAttributes,
+)
+
+# Span attribute keys, bound once at module level for the per-span hot path
+_RESPONSE_MODEL_KEY = GenAIAttributes.GEN_AI_RESPONSE_MODEL
+_REQUEST_MODEL_KEY = GenAIAttributes.GEN_AI_REQUEST_MODEL
+_INPUT_TOKENS_KEY = GenAIAttributes.GEN_AI_USAGE_INPUT_TOKENS
+_OUTPUT_TOKENS_KEY = GenAIAttributes.GEN_AI_USAGE_OUTPUT_TOKENS
+_INPUT_COST_KEY = "gen_ai.usage.input_cost"
+_OUTPUT_COST_KEY = "gen_ai.usage.output_cost"
+_TOTAL_COST_KEY = "gen_ai.usage.cost"
+
+# Trie key marking the end of a model name; never collides with a single character
+_TERMINAL = ""
+
+# Marks a model name missing from the resolve cache (None is a valid cached result)
+_SENTINEL = object()
+
+# Upper bound on cached lookups, so noisy or ad-hoc model names can't grow it unbounded
+_RESOLVE_CACHE_MAXSIZE = 1024
+
+
+def _strip_date_suffix(name: str) -> str:
+    """
+    Strip a trailing -YYYY-MM-DD and then a trailing -YYYYMMDD from a model name.
+
+    Uses fixed-width slice checks instead of regexes since this runs for every span.
+    """
+    if (
+        len(name) >= 11
+        and name[-11] == "-"
+        and name[-6] == "-"
+        and name[-3] == "-"
+        and name[-10:-6].isdecimal()
+        and name[-5:-3].isdecimal()
+        and name[-2:].isdecimal()
+    ):
+        name = name[:-11]
+    if len(name) >= 9 and name[-9] == "-" and name[-8:].isdecimal():
+        name = name[:-9]
+    return name
 
 
 class PricingCalculator:
@@ -17,10 +60,37 @@ class PricingCalculator:
         Args:
             pricing_data: Pricing dictionary with 'chat' and 'embeddings' keys.
         """
-        self.chat_models = pricing_data.get("chat", {})
+        # Normalized once here so lookups can return the stored per-token mapping
+        # directly; read-only views keep callers from mutating the shared entries.
+        self.chat_models = {
+            model_name: MappingProxyType(self._normalize_pricing(pricing))
+            for model_name, pricing in pricing_data.get("chat", {}).items()
+        }
         self.embedding_models = pricing_data.get("embeddings", {})
+        self._prefix_trie = self._build_prefix_trie(self.chat_models)
+        self._resolve_cache: OrderedDict[str, Optional[Mapping[str, float]]] = OrderedDict()
+
+    @staticmethod
+    def _build_prefix_trie(models: dict) -> dict:
+        """
+        Build a character trie over model names for longest-prefix matching.
 
-    def find_pricing(self, model_name: str) -> Optional[dict]:
+        Args:
+            models: Dict mapping model name to normalized pricing.
+
+        Returns:
+            Nested dict keyed by character; a node holding the terminal key maps it
+            to the pricing of the model name ending at that node.
+        """
+        trie: dict = {}
+        for model_name, pricing in models.items():
+            node = trie
+            for ch in model_name:
+                node = node.setdefault(ch, {})
+            node[_TERMINAL] = pricing
+        return trie
+
+    def find_pricing(self, model_name: str) -> Optional[Mapping[str, float]]:
         """
         Find pricing for a model using multi-tier matching.
 
@@ -30,40 +100,69 @@ class PricingCalculator:
         3. Prefix match (longest wins)
         4. Return None (don't fail, just skip cost)
 
+        Results, including misses, are kept in a bounded LRU cache per model name.
+
         Args:
             model_name: Model name from span attributes
 
         Returns:
-            Normalized pricing dict with input_cost_per_token and output_cost_per_token,
-            or None if not found.
+            Read-only normalized pricing mapping with input_cost_per_token and
+            output_cost_per_token, or None if not found.
         """
         if not model_name:
             return None
 
+        cache = self._resolve_cache
+        cached = cache.get(model_name, _SENTINEL)
+        if cached is not _SENTINEL:
+            try:
+                cache.move_to_end(model_name)
+            except KeyError:
+                # Evicted by a concurrent lookup; the value we read is still valid
+                pass
+            return cast(Optional[Mapping[str, float]], cached)
+
+        pricing = self._match_pricing(model_name)
+        cache[model_name] = pricing
+        if len(cache) > _RESOLVE_CACHE_MAXSIZE:
+            cache.popitem(last=False)
+        return pricing
+
+    def _match_pricing(self, model_name: str) -> Optional[Mapping[str, float]]:
+        """
+        Resolve pricing for a model name without consulting the cache.
+
+        Args:
+            model_name: Non-empty model name from span attributes
+
+        Returns:
+            Read-only normalized pricing mapping, or None if no tier matched.
+        """
         models = self.chat_models
 
         # 1. Exact match
-        if model_name in models:
-            return self._normalize_pricing(models[model_name])
+        hit = models.get(model_name)
+        if hit is not None:
+            return hit
 
         # 2. Strip date suffix patterns and retry
-        stripped = re.sub(r"-\d{4}-\d{2}-\d{2}$", "", model_name)
-        stripped = re.sub(r"-\d{8}$", "", stripped)
-        if stripped != model_name and stripped in models:
-            return self._normalize_pricing(models[stripped])
+        stripped = _strip_date_suffix(model_name)
+        if stripped != model_name:
+            hit = models.get(stripped)
+            if hit is not None:
+                return hit
 
         # 3. Prefix match (longest match wins)
         best_match = None
-        best_len = 0
-        for base_model in models.keys():
-            if model_name.startswith(base_model) and len(base_model) > best_len:
-                best_match = base_model
-                best_len = len(base_model)
-
-        if best_match:
-            return self._normalize_pricing(models[best_match])
+        node = self._prefix_trie
+        for ch in model_name:
+            child = node.get(ch)
+            if child is None:
+                break
+            node = child
+            best_match = node.get(_TERMINAL, best_match)
 
-        return None
+        return best_match
 
     def _normalize_pricing(self, pricing: dict) -> dict:
         """
@@ -95,16 +194,19 @@ class PricingCalculator:
         if not hasattr(span, "_attributes") or not span._attributes:
             return
 
-        attrs = span._attributes
+        # ReadableSpan types _attributes as a read-only Mapping, but the SDK stores
+        # them in a mutable BoundedAttributes, which this callback writes to
+        attrs = cast(MutableMapping[str, Any], span._attributes)
+        get = attrs.get
 
         # Get model (prefer response model, fall back to request model)
-        model = attrs.get("gen_ai.response.model") or attrs.get("gen_ai.request.model")
-        if not model:
+        model = get(_RESPONSE_MODEL_KEY) or get(_REQUEST_MODEL_KEY)
+        if not isinstance(model, str) or not model:
             return
 
         # Get token counts
-        input_tokens = attrs.get("gen_ai.usage.input_tokens")
-        output_tokens = attrs.get("gen_ai.usage.output_tokens")
+        input_tokens = get(_INPUT_TOKENS_KEY)
+        output_tokens = get(_OUTPUT_TOKENS_KEY)
 
         if input_tokens is None and output_tokens is None:
             return
@@ -120,6 +222,6 @@ class PricingCalculator:
         total_cost = input_cost + output_cost
 
         # Set cost attributes (modifying in place)
-        attrs["gen_ai.usage.input_cost"] = input_cost
-        attrs["gen_ai.usage.output_cost"] = output_cost
-        attrs["gen_ai.usage.cost"] = total_cost
+        attrs[_INPUT_COST_KEY] = input_cost
+        attrs[_OUTPUT_COST_KEY] = output_cost
+        attrs[_TOTAL_COST_KEY] = total_cost
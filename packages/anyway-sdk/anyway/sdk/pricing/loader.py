@@ -1,12 +1,25 @@
+import functools
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
+_loads: Callable[[bytes], Any]
+try:
+    import orjson
 
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=8)
 def load_pricing(pricing_json_path: Optional[str] = None) -> dict:
     """
     Load pricing data from a JSON file.
 
+    Results are cached per path, so the returned dict is shared between callers
+    and must not be mutated.
+
     Args:
         pricing_json_path: Path to custom pricing JSON file.
                           If None, uses bundled default pricing.
@@ -16,12 +29,13 @@ def load_pricing(pricing_json_path: Optional[str] = None) -> dict:
 
     Raises:
         FileNotFoundError: If custom path provided but file doesn't exist.
-        json.JSONDecodeError: If JSON is invalid.
+        json.JSONDecodeError: If JSON is invalid (orjson's error subclasses it).
     """
     if pricing_json_path is None:
         # Use bundled default pricing
         default_path = Path(__file__).parent / "data" / "default_pricing.json"
         pricing_json_path = str(default_path)
 
-    with open(pricing_json_path, "r") as f:
-        return json.load(f)
+    # Read bytes: orjson only accepts bytes, and json.loads handles them too
+    with open(pricing_json_path, "rb") as f:
+        return _loads(f.read())
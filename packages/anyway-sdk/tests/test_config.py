@@ -0,0 +1,23 @@
+import pytest
+from anyway.sdk.config import is_content_tracing_enabled, refresh_config
+
+
+@pytest.fixture
+def env(monkeypatch):
+    yield monkeypatch
+    # Restore the environment before re-reading it so later tests see the original flags
+    monkeypatch.undo()
+    refresh_config()
+
+
+def test_flags_are_cached_until_refresh(env):
+    """Test that env changes after import only apply once refresh_config() runs."""
+    env.delenv("TRACELOOP_TRACE_CONTENT", raising=False)
+    refresh_config()
+    assert is_content_tracing_enabled() is True
+
+    env.setenv("TRACELOOP_TRACE_CONTENT", "false")
+    assert is_content_tracing_enabled() is True
+
+    refresh_config()
+    assert is_content_tracing_enabled() is False
@@ -1,5 +1,6 @@
 import json
 import pytest
+from unittest.mock import patch
 from anyway.sdk.pricing import PricingCalculator, load_pricing
 
 
@@ -12,6 +13,10 @@ class TestPricingLoader:
         # Check some known models exist
         assert "gpt-4o" in pricing["chat"]
 
+    def test_load_default_pricing_is_cached(self):
+        """Test that repeated loads of the same path reuse the parsed data."""
+        assert load_pricing() is load_pricing()
+
     def test_load_custom_pricing(self, tmp_path):
         """Test loading custom pricing from a file path."""
         custom_pricing = {
@@ -73,6 +78,12 @@ class TestPricingCalculator:
         # 2.5 per 1K tokens = 0.0025 per token
         assert pricing["input_cost_per_token"] == 0.0025
 
+    def test_returned_pricing_is_read_only(self, custom_calculator):
+        """Test that shared pricing entries can't be mutated by callers."""
+        pricing = custom_calculator.find_pricing("gpt-4o")
+        with pytest.raises(TypeError):
+            pricing["input_cost_per_token"] = 0
+
     def test_date_suffix_stripping(self, custom_calculator):
         """Test matching by stripping date suffix."""
         # gpt-4o-2024-08-06 should match gpt-4o after stripping
@@ -93,11 +104,56 @@ class TestPricingCalculator:
         assert pricing is not None
         assert pricing["input_cost_per_token"] == 0.00015
 
+    def test_prefix_match_independent_of_key_order(self):
+        """Test that the longest prefix wins regardless of pricing key order."""
+        calculator = PricingCalculator(
+            {
+                "chat": {
+                    "gpt-4o-mini": {"promptPrice": 0.15, "completionPrice": 0.6},
+                    "gpt": {"promptPrice": 1.0, "completionPrice": 1.0},
+                    "gpt-4o": {"promptPrice": 2.5, "completionPrice": 10.0},
+                },
+                "embeddings": {},
+            }
+        )
+        assert calculator.find_pricing("gpt-4o-mini-variant")["input_cost_per_token"] == 0.00015
+        assert calculator.find_pricing("gpt-4o-variant")["input_cost_per_token"] == 0.0025
+        assert calculator.find_pricing("gpt-3.5-turbo")["input_cost_per_token"] == 0.001
+
     def test_unknown_model_returns_none(self, custom_calculator):
         """Test that unknown models return None."""
         pricing = custom_calculator.find_pricing("unknown-model")
         assert pricing is None
 
+    def test_find_pricing_is_cached(self, custom_calculator):
+        """Test that repeated lookups, including misses, are served from the cache."""
+        first = custom_calculator.find_pricing("gpt-4o-2024-08-06")
+        assert custom_calculator._resolve_cache["gpt-4o-2024-08-06"] is first
+        assert custom_calculator.find_pricing("unknown-model") is None
+        assert "unknown-model" in custom_calculator._resolve_cache
+
+        with patch.object(custom_calculator, "_match_pricing") as match:
+            assert custom_calculator.find_pricing("gpt-4o-2024-08-06") is first
+            assert custom_calculator.find_pricing("unknown-model") is None
+        match.assert_not_called()
+
+    def test_find_pricing_cache_is_bounded(self, custom_calculator):
+        """Test that the lookup cache evicts least recently used model names."""
+        from anyway.sdk.pricing.calculator import _RESOLVE_CACHE_MAXSIZE
+
+        custom_calculator.find_pricing("gpt-4o")
+        custom_calculator.find_pricing("gpt-4o-mini")
+        # Touch gpt-4o so gpt-4o-mini becomes the least recently used entry
+        custom_calculator.find_pricing("gpt-4o")
+        for i in range(_RESOLVE_CACHE_MAXSIZE - 1):
+            custom_calculator.find_pricing(f"unknown-model-{i}")
+
+        cache = custom_calculator._resolve_cache
+        assert len(cache) == _RESOLVE_CACHE_MAXSIZE
+        assert "gpt-4o" in cache
+        assert "gpt-4o-mini" not in cache
+        assert "unknown-model-0" in cache
+
     def test_none_input_returns_none(self, custom_calculator):
         """Test that None input returns None."""
         assert custom_calculator.find_pricing(None) is None